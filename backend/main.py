@@ -4,30 +4,74 @@ FastAPI backend for pose conversion, segmentation, and translation.
 Endpoints:
 - GET /api/health - Health check
 - POST /api/segment - Convert landmarks and run segmentation
+- POST /api/segment_stream - Segmentation on a streamed binary landmark body
 - POST /api/translate - Full pipeline: segment, transcribe, translate to text
 - POST /api/translate-spamo - SpaMo video-to-text translation
 """
 
-from fastapi import FastAPI, HTTPException
+import os
+
+# Load CUDA kernels lazily; must be set before torch is first imported
+os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing import Optional, List
+import asyncio
 import logging
-import tempfile
-import os
+import math
+import multiprocessing
 import base64
 import io
+import numpy as np
+import orjson
+from blake3 import blake3
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from PIL import Image
+from pose_format.utils.generic import reduce_holistic
+from sign_language_segmentation.bin import segment_pose
 
-from pose_converter import frames_to_pose
+from pose_converter import (
+    TOTAL_POINTS, LandmarkStreamReader, acquire_pose_buffers, build_pose,
+    read_landmarks_binary, read_landmarks_json, release_pose_buffers
+)
 from segmentation_service import segment
-from translation_service import translate_signs
-from spamo_service import translate_frames as spamo_translate
+from transcription_service import (
+    download_transcription_model, init_transcription_worker, transcribe_signs
+)
+from translation_service import get_translator, translate_signs
+from spamo_service import allocate_frames, translate_frames as spamo_translate, warmup as spamo_warmup
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Worker processes that parse landmark request bodies into NumPy arrays
+POSE_WORKERS = 2
+_pose_pool = ProcessPoolExecutor(
+    max_workers=POSE_WORKERS,
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
+# Worker processes for SignWriting transcription; signs are sharded across them
+TRANSCRIPTION_WORKERS = os.cpu_count() or 1
+
+# Most signs per transcription chunk; each chunk is translated while later
+# chunks are still being transcribed
+PIPELINE_CHUNK_SIZE = 8
+
+# Limits of /api/translate-spamo, checked before the frame array is allocated
+SPAMO_MAX_FRAMES = 1000
+SPAMO_MAX_FRAME_BYTES = 512 * 1024 * 1024  # all frames as decoded RGB
+
+# Encoded translation responses keyed by a hash of the request, so retrying the
+# same clip skips segmentation, transcription and translation entirely
+_translate_cache = TTLCache(maxsize=1024, ttl=3600)
+
 app = FastAPI(
     title="Sign2Speech Backend",
     description="Pose conversion and sign language segmentation API",
@@ -58,6 +102,72 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+def load_models():
+    """
+    Load the models once, before the first request.
+
+    The transcription model is downloaded here and then loaded by each worker
+    process of the pool; the text translation model is loaded in-process.
+    """
+    download_transcription_model()
+    get_translator()
+    app.state.transcription_pool = ProcessPoolExecutor(
+        max_workers=TRANSCRIPTION_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_transcription_worker,
+    )
+    warm_up_pipeline()
+
+
+def warm_up_pipeline():
+    """
+    Run every pipeline stage once on a short synthetic clip.
+
+    The first real request then runs at steady-state speed instead of paying
+    for lazy initialization in torch, the models and the worker processes.
+    Failures are only logged, since warm-up is an optimization.
+    """
+    landmarks = np.random.default_rng(0).random((4, 10, TOTAL_POINTS), dtype=np.float32)
+
+    try:
+        # One tiny parse per body-parsing worker, so every worker process is
+        # spawned and has imported pose_converter before the first request
+        body = orjson.dumps({"num_frames": 1}) + b"\n" + bytes(TOTAL_POINTS * 7)
+        parses = [
+            _pose_pool.submit(read_landmarks_binary, body, ())
+            for _ in range(POSE_WORKERS)
+        ]
+        for future in parses:
+            future.result()
+
+        pose = build_pose(landmarks, width=640, height=480, fps=30.0)
+        segment_pose(pose, verbose=False)
+        preprocessed_pose = reduce_holistic(pose)
+
+        # One shard per worker, so each worker process is started and warmed
+        futures = [
+            app.state.transcription_pool.submit(transcribe_signs, preprocessed_pose, [(0, 300, "")])
+            for _ in range(TRANSCRIPTION_WORKERS)
+        ]
+        signwriting = [future.result() for future in futures][0]
+        translate_signs(signwriting, "en")
+        logger.info("Pipeline warm-up complete")
+    except Exception as e:
+        logger.warning(f"Pipeline warm-up failed: {e}", exc_info=True)
+
+    try:
+        spamo_warmup()
+    except Exception as e:
+        logger.warning(f"SpaMo warm-up failed: {e}", exc_info=True)
+
+
+@app.on_event("shutdown")
+def stop_workers():
+    app.state.transcription_pool.shutdown(cancel_futures=True)
+    _pose_pool.shutdown(cancel_futures=True)
+
+
 # Pydantic models for request/response
 class Landmark(BaseModel):
     x: float
@@ -73,13 +183,16 @@ class PoseFrame(BaseModel):
     rightHandLandmarks: Optional[list[Landmark]] = None
 
 
-class SegmentRequest(BaseModel):
-    frames: list[PoseFrame]
+class SegmentMeta(BaseModel):
     width: int
     height: int
     fps: float = 30.0
 
 
+class SegmentRequest(SegmentMeta):
+    frames: list[PoseFrame]
+
+
 class SegmentBoundary(BaseModel):
     start_frame: int
     end_frame: int
@@ -94,14 +207,14 @@ class SegmentResponse(BaseModel):
     duration: float
 
 
-class TranslateRequest(BaseModel):
-    frames: list[PoseFrame]
-    width: int
-    height: int
-    fps: float = 30.0
+class TranslateMeta(SegmentMeta):
     target_language: str = "en"
 
 
+class TranslateRequest(TranslateMeta):
+    frames: list[PoseFrame]
+
+
 class TranslatedSign(BaseModel):
     start_frame: int
     end_frame: int
@@ -133,110 +246,225 @@ class SpaMoResponse(BaseModel):
     target_language: str
 
 
-@app.get("/api/health")
-async def health():
-    """Health check endpoint."""
-    return {"status": "ok", "service": "sign2speech-backend"}
+# The landmark endpoints read the raw JSON body instead of validating every
+# Landmark through Pydantic; only the top-level scalars are validated.
+segment_meta_adapter = TypeAdapter(SegmentMeta)
+translate_meta_adapter = TypeAdapter(TranslateMeta)
+META_FIELDS = tuple(TranslateMeta.model_fields)
+
+
+def openapi_request_body(model: type[BaseModel]) -> dict:
+    """Document a raw-body endpoint with the JSON schema of a request model."""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
 
+    def inline(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
 
-@app.post("/api/segment", response_model=SegmentResponse)
-async def segment_endpoint(request: SegmentRequest):
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    }
+
+
+async def read_pose_request(request: Request, meta_adapter: TypeAdapter) -> tuple[BaseModel, np.ndarray]:
     """
-    Convert MediaPipe Holistic landmarks to pose format and run segmentation.
+    Parse a landmarks request body without building Pydantic Landmark objects.
 
-    Returns sign and sentence boundaries detected in the pose sequence.
+    The body is parsed lazily with simdjson and the landmarks are read straight
+    into a (4, frames, points) array, so no per-landmark dicts are created.
+    Bodies sent as application/octet-stream use the quantized binary format
+    instead (see pose_converter.read_landmarks_binary).
+    Parsing runs in the pose worker pool to keep the event loop free.
+
+    Returns the validated top-level fields and the landmark array.
     """
-    if not request.frames:
-        raise HTTPException(status_code=400, detail="No frames provided")
+    body = await request.body()
+    loop = asyncio.get_running_loop()
 
-    if len(request.frames) < 10:
+    # Quantized binary landmarks from the web client, JSON otherwise
+    if request.headers.get("content-type", "").startswith("application/octet-stream"):
+        reader = read_landmarks_binary
+    else:
+        reader = read_landmarks_json
+
+    try:
+        fields, landmarks = await loop.run_in_executor(
+            _pose_pool, reader, body, META_FIELDS
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        meta = meta_adapter.validate_python(fields)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    return meta, landmarks
+
+
+def json_response(content) -> Response:
+    """
+    Encode a response body with orjson.
+
+    Returning a Response skips FastAPI's response_model validation and
+    jsonable_encoder walk; response_model still documents the endpoint.
+    """
+    return Response(orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY), media_type="application/json")
+
+
+def request_cache_key(meta: BaseModel, landmarks: np.ndarray) -> str:
+    """Hash the landmark array and the request fields into a cache key."""
+    hasher = blake3(np.ascontiguousarray(landmarks).view(np.uint8))
+    hasher.update(meta.model_dump_json().encode())
+    return hasher.hexdigest()
+
+
+async def run_segmentation(meta: SegmentMeta, landmarks: np.ndarray) -> Response:
+    """Build a Pose from read landmarks and run segmentation on it."""
+    num_frames = landmarks.shape[1]
+
+    if num_frames < 10:
         raise HTTPException(
             status_code=400,
-            detail=f"Too few frames ({len(request.frames)}). Need at least 10 frames for segmentation."
+            detail=f"Too few frames ({num_frames}). Need at least 10 frames for segmentation."
         )
 
-    logger.info(f"Received segmentation request: {len(request.frames)} frames, {request.width}x{request.height}, {request.fps}fps")
+    logger.info(f"Received segmentation request: {num_frames} frames, {meta.width}x{meta.height}, {meta.fps}fps")
 
     try:
-        # Convert frames to list of dicts for pose_converter
-        frames_data = []
-        for frame in request.frames:
-            frame_dict = {
-                'poseLandmarks': [lm.model_dump() for lm in frame.poseLandmarks] if frame.poseLandmarks else None,
-                'faceLandmarks': [lm.model_dump() for lm in frame.faceLandmarks] if frame.faceLandmarks else None,
-                'leftHandLandmarks': [lm.model_dump() for lm in frame.leftHandLandmarks] if frame.leftHandLandmarks else None,
-                'rightHandLandmarks': [lm.model_dump() for lm in frame.rightHandLandmarks] if frame.rightHandLandmarks else None,
-            }
-            frames_data.append(frame_dict)
-
-        # Convert to Pose object
-        pose = frames_to_pose(
-            frames=frames_data,
-            width=request.width,
-            height=request.height,
-            fps=request.fps
+        # Convert to Pose object, backed by pooled buffers
+        buffers = acquire_pose_buffers(num_frames)
+        pose = build_pose(
+            landmarks=landmarks,
+            width=meta.width,
+            height=meta.height,
+            fps=meta.fps,
+            buffers=buffers
         )
 
         logger.info(f"Created Pose object with shape: {pose.body.data.shape}")
 
-        # Run segmentation
-        result = segment(pose, fps=request.fps)
+        # Run segmentation off the event loop
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, partial(segment, pose, fps=meta.fps))
 
         logger.info(f"Segmentation complete: {len(result['signs'])} signs, {len(result['sentences'])} sentences")
 
-        return SegmentResponse(**result)
+        # Only reuse the buffers once nothing can still be reading the pose
+        release_pose_buffers(buffers)
+        return json_response(result)
 
     except Exception as e:
         logger.error(f"Segmentation failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Segmentation failed: {str(e)}")
 
 
-@app.post("/api/translate", response_model=TranslateResponse)
-async def translate_endpoint(request: TranslateRequest):
+@app.get("/api/health")
+async def health():
+    """Health check endpoint."""
+    return {"status": "ok", "service": "sign2speech-backend"}
+
+
+@app.post(
+    "/api/segment",
+    response_model=SegmentResponse,
+    openapi_extra=openapi_request_body(SegmentRequest),
+)
+async def segment_endpoint(request: Request):
+    """
+    Convert MediaPipe Holistic landmarks to pose format and run segmentation.
+
+    Returns sign and sentence boundaries detected in the pose sequence.
+    """
+    meta, landmarks = await read_pose_request(request, segment_meta_adapter)
+    return await run_segmentation(meta, landmarks)
+
+
+@app.post("/api/segment_stream", response_model=SegmentResponse)
+async def segment_stream_endpoint(request: Request):
+    """
+    Run segmentation on landmarks streamed in the binary frame format.
+
+    The body is a JSON header line with width, height, fps and num_frames,
+    followed by num_frames frames of 543 x (x, y, z, visibility) float32
+    values. Frames are decoded while the body is still being received.
+    """
+    try:
+        content_length = request.headers.get('content-length')
+        reader = LandmarkStreamReader(int(content_length) if content_length else None)
+        async for chunk in request.stream():
+            reader.feed(chunk)
+        header, landmarks = reader.finish()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        meta = segment_meta_adapter.validate_python({
+            key: header[key] for key in META_FIELDS if key in header
+        })
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    return await run_segmentation(meta, landmarks)
+
+
+@app.post(
+    "/api/translate",
+    response_model=TranslateResponse,
+    openapi_extra=openapi_request_body(TranslateRequest),
+)
+async def translate_endpoint(request: Request):
     """
     Full translation pipeline: segment poses, transcribe to SignWriting, translate to text.
 
     Returns sign boundaries with SignWriting notation and English text translation.
     """
-    if not request.frames:
-        raise HTTPException(status_code=400, detail="No frames provided")
+    meta, landmarks = await read_pose_request(request, translate_meta_adapter)
+    num_frames = landmarks.shape[1]
 
-    if len(request.frames) < 10:
+    if num_frames < 10:
         raise HTTPException(
             status_code=400,
-            detail=f"Too few frames ({len(request.frames)}). Need at least 10 frames for translation."
+            detail=f"Too few frames ({num_frames}). Need at least 10 frames for translation."
         )
 
-    logger.info(f"Received translation request: {len(request.frames)} frames, {request.width}x{request.height}, {request.fps}fps")
+    logger.info(f"Received translation request: {num_frames} frames, {meta.width}x{meta.height}, {meta.fps}fps")
+
+    cache_key = request_cache_key(meta, landmarks)
+    cached = _translate_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Serving translation from cache")
+        return Response(cached, media_type="application/json")
 
     try:
-        # Convert frames to list of dicts for pose_converter
-        frames_data = []
-        for frame in request.frames:
-            frame_dict = {
-                'poseLandmarks': [lm.model_dump() for lm in frame.poseLandmarks] if frame.poseLandmarks else None,
-                'faceLandmarks': [lm.model_dump() for lm in frame.faceLandmarks] if frame.faceLandmarks else None,
-                'leftHandLandmarks': [lm.model_dump() for lm in frame.leftHandLandmarks] if frame.leftHandLandmarks else None,
-                'rightHandLandmarks': [lm.model_dump() for lm in frame.rightHandLandmarks] if frame.rightHandLandmarks else None,
-            }
-            frames_data.append(frame_dict)
-
-        # Convert to Pose object
-        pose = frames_to_pose(
-            frames=frames_data,
-            width=request.width,
-            height=request.height,
-            fps=request.fps
+        # Convert to Pose object, backed by pooled buffers
+        buffers = acquire_pose_buffers(num_frames)
+        pose = build_pose(
+            landmarks=landmarks,
+            width=meta.width,
+            height=meta.height,
+            fps=meta.fps,
+            buffers=buffers
         )
 
         logger.info(f"Created Pose object with shape: {pose.body.data.shape}")
 
+        loop = asyncio.get_running_loop()
+
         # Step 1: Run segmentation
-        from sign_language_segmentation.bin import segment_pose
-        eaf, tiers = segment_pose(pose, verbose=False)
+        eaf, tiers = await loop.run_in_executor(None, partial(segment_pose, pose, verbose=False))
 
         frame_count = pose.body.data.shape[0]
-        duration = frame_count / request.fps
+        duration = frame_count / meta.fps
 
         # Extract segments
         sign_segments = tiers.get("SIGN", [])
@@ -244,94 +472,123 @@ async def translate_endpoint(request: TranslateRequest):
 
         if not sign_segments:
             logger.info("No signs detected in pose data")
-            return TranslateResponse(
-                signs=[],
-                sentences=[],
-                full_text="",
-                frame_count=frame_count,
-                duration=duration
-            )
+            response = json_response({
+                "signs": [],
+                "sentences": [],
+                "full_text": "",
+                "frame_count": frame_count,
+                "duration": duration,
+            })
+            _translate_cache[cache_key] = response.body
+            release_pose_buffers(buffers)
+            return response
 
         logger.info(f"Segmentation complete: {len(sign_segments)} signs, {len(sentence_segments)} sentences")
 
         # Step 2: Transcribe to SignWriting
         # Use the library functions directly instead of CLI to avoid file I/O issues
-        from pathlib import Path
-        from pose_format.utils.generic import reduce_holistic
-        from signwriting_transcription.pose_to_signwriting.bin import (
-            download_model, preprocessing_signs
-        )
-        from signwriting_transcription.pose_to_signwriting.joeynmt_pose.prediction import translate as sw_translate
-
-        # Prepare experiment directory and download model
-        experiment_dir = Path('experiment')
-        experiment_dir.mkdir(exist_ok=True)
-        download_model(experiment_dir, 'bc2de71.ckpt')
-
         # Preprocess the pose (reduce holistic without normalization)
-        preprocessed_pose = reduce_holistic(pose)
+        preprocessed_pose = await loop.run_in_executor(None, reduce_holistic, pose)
 
         # Get sign annotations from our segmentation (convert to ms format)
         sign_annotations = []
         for seg in sign_segments:
-            start_ms = int(seg['start'] / request.fps * 1000)
-            end_ms = int(seg['end'] / request.fps * 1000)
+            start_ms = int(seg['start'] / meta.fps * 1000)
+            end_ms = int(seg['end'] / meta.fps * 1000)
             sign_annotations.append((start_ms, end_ms, ""))
 
         logger.info(f"Prepared {len(sign_annotations)} sign annotations for transcription")
 
-        # Run transcription
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_files = preprocessing_signs(preprocessed_pose, sign_annotations, 'tight', temp_dir)
-            signwriting_list = sw_translate('experiment/config.yaml', temp_files)
+        # Steps 2 and 3 run as a pipeline: chunks of signs are transcribed in
+        # the worker pool while earlier chunks are translated to text. At most
+        # one chunk per worker is in flight, and the bounded queue stops new
+        # submissions while translation is behind, so neither stage runs far ahead.
+        queue = asyncio.Queue(maxsize=2)
+        chunk_size = min(PIPELINE_CHUNK_SIZE, math.ceil(len(sign_annotations) / TRANSCRIPTION_WORKERS))
 
-        logger.info(f"Transcribed {len(signwriting_list)} signs to SignWriting: {signwriting_list}")
-
-        # Step 3: Translate SignWriting to text
-        if signwriting_list:
-            translations = translate_signs(signwriting_list, request.target_language)
-        else:
-            translations = []
+        async def transcribe_stage():
+            pending = []
+            try:
+                for start in range(0, len(sign_annotations), chunk_size):
+                    pending.append(loop.run_in_executor(
+                        app.state.transcription_pool, transcribe_signs,
+                        preprocessed_pose, sign_annotations[start:start + chunk_size]
+                    ))
+                    if len(pending) == TRANSCRIPTION_WORKERS:
+                        await queue.put(await pending.pop(0))
+                while pending:
+                    await queue.put(await pending.pop(0))
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        async def translate_stage():
+            signwriting_list, translations = [], []
+            while (chunk := await queue.get()) is not None:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                signwriting_list.extend(chunk)
+                if chunk:
+                    translations.extend(await loop.run_in_executor(
+                        None, translate_signs, chunk, meta.target_language
+                    ))
+            return signwriting_list, translations
+
+        transcriber = asyncio.create_task(transcribe_stage())
+        try:
+            signwriting_list, translations = await translate_stage()
+        finally:
+            transcriber.cancel()
 
+        logger.info(f"Transcribed {len(signwriting_list)} signs to SignWriting: {signwriting_list}")
         logger.info(f"Translated to: {translations}")
 
         # Build response
         translated_signs = []
         for i, seg in enumerate(sign_segments):
-            start_frame = seg['start']
-            end_frame = seg['end']
+            start_frame = int(seg['start'])
+            end_frame = int(seg['end'])
             sw = signwriting_list[i] if i < len(signwriting_list) else ""
             text = translations[i] if i < len(translations) else ""
 
-            translated_signs.append(TranslatedSign(
-                start_frame=start_frame,
-                end_frame=end_frame,
-                start_time=round(start_frame / request.fps, 3),
-                end_time=round(end_frame / request.fps, 3),
-                signwriting=sw,
-                text=text
-            ))
+            translated_signs.append({
+                "start_frame": start_frame,
+                "end_frame": end_frame,
+                "start_time": round(start_frame / meta.fps, 3),
+                "end_time": round(end_frame / meta.fps, 3),
+                "signwriting": sw,
+                "text": text,
+            })
 
         # Build sentence boundaries
         sentences = []
         for seg in sentence_segments:
-            sentences.append(SegmentBoundary(
-                start_frame=seg['start'],
-                end_frame=seg['end'],
-                start_time=round(seg['start'] / request.fps, 3),
-                end_time=round(seg['end'] / request.fps, 3)
-            ))
+            start_frame = int(seg['start'])
+            end_frame = int(seg['end'])
+            sentences.append({
+                "start_frame": start_frame,
+                "end_frame": end_frame,
+                "start_time": round(start_frame / meta.fps, 3),
+                "end_time": round(end_frame / meta.fps, 3),
+            })
 
         # Combine all translations into full text
         full_text = " ".join(translations)
 
-        return TranslateResponse(
-            signs=translated_signs,
-            sentences=sentences,
-            full_text=full_text,
-            frame_count=frame_count,
-            duration=duration
-        )
+        response = json_response({
+            "signs": translated_signs,
+            "sentences": sentences,
+            "full_text": full_text,
+            "frame_count": frame_count,
+            "duration": duration,
+        })
+        _translate_cache[cache_key] = response.body
+        # Only reuse the buffers once nothing can still be reading the pose
+        release_pose_buffers(buffers)
+        return response
 
     except Exception as e:
         logger.error(f"Translation failed: {e}", exc_info=True)
@@ -355,11 +612,18 @@ async def translate_spamo_endpoint(request: SpaMoRequest):
             detail=f"Too few frames ({len(request.frames)}). Need at least 10 frames for translation."
         )
 
+    if len(request.frames) > SPAMO_MAX_FRAMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many frames ({len(request.frames)}). At most {SPAMO_MAX_FRAMES} frames are supported."
+        )
+
     logger.info(f"Received SpaMo translation request: {len(request.frames)} frames, {request.fps}fps")
 
     try:
-        # Decode base64 frames to PIL Images
-        pil_frames = []
+        # Decode base64 frames straight into one (N, H, W, 3) uint8 array,
+        # allocated once the first frame gives the size
+        frames = None
         for i, frame_b64 in enumerate(request.frames):
             try:
                 # Handle data URL format (data:image/jpeg;base64,...)
@@ -367,8 +631,26 @@ async def translate_spamo_endpoint(request: SpaMoRequest):
                     frame_b64 = frame_b64.split(',')[1]
 
                 frame_bytes = base64.b64decode(frame_b64)
-                img = Image.open(io.BytesIO(frame_bytes)).convert('RGB')
-                pil_frames.append(img)
+                # Only the image header is read here; the size is checked
+                # before anything is decoded or allocated
+                img = Image.open(io.BytesIO(frame_bytes))
+                if frames is None:
+                    decoded_size = len(request.frames) * img.width * img.height * 3
+                    if decoded_size > SPAMO_MAX_FRAME_BYTES:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Frames too large ({len(request.frames)} x {img.width}x{img.height}). "
+                                   f"Use fewer or smaller frames."
+                        )
+                    frames = allocate_frames(len(request.frames), img.height, img.width)
+                elif img.size != (frames.shape[2], frames.shape[1]):
+                    raise ValueError(
+                        f"size {img.width}x{img.height} differs from the first frame "
+                        f"({frames.shape[2]}x{frames.shape[1]})"
+                    )
+                frames[i] = np.asarray(img.convert('RGB'))
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Failed to decode frame {i}: {e}")
                 raise HTTPException(
@@ -376,10 +658,10 @@ async def translate_spamo_endpoint(request: SpaMoRequest):
                     detail=f"Failed to decode frame {i}: {str(e)}"
                 )
 
-        logger.info(f"Decoded {len(pil_frames)} frames successfully")
+        logger.info(f"Decoded {len(frames)} frames successfully")
 
         # Run SpaMo translation
-        result = spamo_translate(pil_frames, request.target_language)
+        result = spamo_translate(frames, request.target_language)
 
         if 'error' in result:
             raise HTTPException(status_code=400, detail=result['error'])
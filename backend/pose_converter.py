@@ -5,13 +5,37 @@ The frontend sends landmarks as JSON arrays, and we convert them to the binary
 pose format expected by the segmentation library.
 """
 
+import queue
+import threading
 import numpy as np
+import simdjson
+from itertools import islice
 from typing import Optional
 from pose_format import Pose
 from pose_format.numpy import NumPyPoseBody
 from pose_format.pose_header import PoseHeader, PoseHeaderDimensions, PoseHeaderComponent
 from pose_format.utils.holistic import holistic_components
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, scale_landmarks falls back to NumPy
+    njit = None
+
+
+# Standard MediaPipe Holistic point counts
+POSE_POINTS = 33
+FACE_POINTS = 468
+HAND_POINTS = 21
+TOTAL_POINTS = POSE_POINTS + FACE_POINTS + HAND_POINTS * 2  # 543
+
+# Frontend landmark keys in pose-format component order
+HOLISTIC_LAYOUT = (
+    ('poseLandmarks', POSE_POINTS),
+    ('faceLandmarks', FACE_POINTS),
+    ('leftHandLandmarks', HAND_POINTS),
+    ('rightHandLandmarks', HAND_POINTS),
+)
+
 
 def create_holistic_header(width: int, height: int, depth: int = 0) -> PoseHeader:
     """
@@ -30,6 +54,355 @@ def create_holistic_header(width: int, height: int, depth: int = 0) -> PoseHeade
     )
 
 
+_thread_state = threading.local()
+
+
+def parse_json(body: bytes):
+    """
+    Parse a JSON request body with a reusable per-thread simdjson parser.
+
+    Objects and arrays in the returned document are lazy views; fields are
+    only converted to Python values when accessed.
+    """
+    parser = getattr(_thread_state, 'parser', None)
+    if parser is None:
+        parser = _thread_state.parser = simdjson.Parser()
+
+    try:
+        return parser.parse(body)
+    except RuntimeError:
+        # A document from this parser is still referenced, start a fresh one
+        parser = _thread_state.parser = simdjson.Parser()
+        return parser.parse(body)
+
+
+def _landmark_rows(component, num_points: int) -> list[tuple]:
+    """Read up to num_points (x, y, z, visibility) rows from one landmark component."""
+    landmarks = islice(component, num_points)
+    return [
+        (lm['x'], lm['y'], lm['z'], 1.0 if (visibility := lm.get('visibility')) is None else visibility)
+        for lm in landmarks
+    ]
+
+
+def read_landmarks(frames) -> np.ndarray:
+    """
+    Read frontend landmark frames into a single normalized array.
+
+    Args:
+        frames: Sequence of frame mappings with poseLandmarks, faceLandmarks,
+                leftHandLandmarks, rightHandLandmarks. Either plain dicts or
+                lazy simdjson documents, which are read without building dicts.
+
+    Returns:
+        numpy array of shape (4, frames, total_points) holding the normalized
+        x, y, z and visibility of each point; missing points are zero.
+        Each channel is one contiguous stream (structure of arrays), so it
+        can be scaled with unit-stride operations.
+    """
+    landmarks = np.zeros((4, len(frames), TOTAL_POINTS), dtype=np.float32)
+
+    for frame_idx, frame in enumerate(frames):
+        point_offset = 0
+        for key, num_points in HOLISTIC_LAYOUT:
+            component = frame.get(key)
+            if component:
+                rows = _landmark_rows(component, num_points)
+                points = slice(point_offset, point_offset + len(rows))
+                landmarks[:, frame_idx, points].T[:] = rows
+            point_offset += num_points
+
+    return landmarks
+
+
+def read_landmarks_json(body: bytes, fields: tuple[str, ...]) -> tuple[dict, np.ndarray]:
+    """
+    Parse a landmarks request body into its top-level fields and landmarks.
+
+    Self-contained so it can run in a worker process: only plain values and
+    the landmark array are returned, never parts of the simdjson document.
+
+    Args:
+        body: Raw JSON request body with a "frames" array
+        fields: Names of the top-level fields to return alongside the frames
+
+    Returns:
+        Dict of the requested top-level fields present in the body, and the
+        landmark array from read_landmarks
+
+    Raises:
+        ValueError: If the body is not valid JSON or has no usable frames
+    """
+    try:
+        doc = parse_json(body)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON body: {str(e)}")
+
+    if not isinstance(doc, simdjson.Object):
+        raise ValueError("Request body must be a JSON object")
+
+    frames = doc.get('frames')
+    if not frames or not isinstance(frames, simdjson.Array):
+        raise ValueError("No frames provided")
+
+    try:
+        landmarks = read_landmarks(frames)
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        # AttributeError: a frame or landmark that is not a JSON object
+        raise ValueError(f"Invalid landmarks: {str(e)}")
+
+    values = {}
+    for key in fields:
+        if key in doc:
+            value = doc[key]
+            if isinstance(value, simdjson.Object):
+                value = value.as_dict()
+            elif isinstance(value, simdjson.Array):
+                value = value.as_list()
+            values[key] = value
+
+    return values, landmarks
+
+
+# Quantized binary landmarks: x/y/z as int16 in units of 1/QUANT_SCALE, which
+# keeps off-screen points in [-2, 2), and visibility as uint8 in units of 1/255
+QUANT_SCALE = 16384
+VISIBILITY_SCALE = 255
+
+
+def read_landmarks_binary(body: bytes, fields: tuple[str, ...]) -> tuple[dict, np.ndarray]:
+    """
+    Decode a quantized binary landmarks body into its header fields and landmarks.
+
+    The body is one JSON header line with num_frames and the request fields,
+    followed by an int16 block of shape (3, num_frames, total_points) holding
+    x, y and z, and a uint8 block of shape (num_frames, total_points) holding
+    visibility. Decoding is a frombuffer and a scale per block.
+
+    Args:
+        body: Raw request body
+        fields: Names of the header fields to return
+
+    Returns:
+        Dict of the requested header fields, and the landmark array in the
+        same layout as read_landmarks
+
+    Raises:
+        ValueError: If the header or the block sizes are invalid
+    """
+    end = body.find(b'\n')
+    if end < 0:
+        raise ValueError("Binary body has no header line")
+
+    try:
+        header = parse_json(body[:end]).as_dict()
+    except (ValueError, AttributeError):
+        raise ValueError("Binary header must be a JSON object")
+
+    num_frames = header.get('num_frames')
+    if not isinstance(num_frames, int) or num_frames <= 0:
+        raise ValueError("No frames provided")
+
+    num_values = num_frames * TOTAL_POINTS
+    offset = end + 1
+    if len(body) - offset != num_values * 3 * 2 + num_values:
+        raise ValueError(f"Binary body size does not match {num_frames} frames")
+
+    xyz = np.frombuffer(body, dtype='<i2', count=num_values * 3, offset=offset)
+    visibility = np.frombuffer(body, dtype=np.uint8, count=num_values, offset=offset + num_values * 3 * 2)
+
+    landmarks = np.empty((4, num_frames, TOTAL_POINTS), dtype=np.float32)
+    np.multiply(xyz.reshape(3, num_frames, TOTAL_POINTS), np.float32(1 / QUANT_SCALE), out=landmarks[:3])
+    np.multiply(visibility.reshape(num_frames, TOTAL_POINTS), np.float32(1 / VISIBILITY_SCALE), out=landmarks[3])
+
+    return {key: header[key] for key in fields if key in header}, landmarks
+
+
+class LandmarkStreamReader:
+    """
+    Incrementally decode the binary landmark stream format.
+
+    The stream starts with a single JSON header line, e.g.
+    {"width": 1280, "height": 720, "fps": 30, "num_frames": 90}, followed by
+    exactly num_frames frames. Each frame is TOTAL_POINTS * 4 little-endian
+    float32 values: normalized x, y, z and visibility per point in holistic
+    order, with zeros for missing points.
+
+    Chunks can be fed as they arrive; complete frames are written straight
+    into the preallocated landmark array used by read_landmarks. The array is
+    only allocated once num_frames is within MAX_FRAMES and, when the body
+    length is known, matches it.
+    """
+
+    FRAME_BYTES = TOTAL_POINTS * 4 * 4
+    MAX_HEADER_BYTES = 64 * 1024
+    # 10 minutes at 30 fps, about 150 MB of landmarks
+    MAX_FRAMES = 18000
+
+    def __init__(self, content_length: Optional[int] = None):
+        self.content_length = content_length
+        self.header: Optional[dict] = None
+        self.landmarks: Optional[np.ndarray] = None
+        self.frames_read = 0
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the request body."""
+        self._buffer += chunk
+
+        if self.header is None:
+            end = self._buffer.find(b'\n')
+            if end < 0:
+                if len(self._buffer) > self.MAX_HEADER_BYTES:
+                    raise ValueError("Stream header line is too long")
+                return
+            self._read_header(bytes(self._buffer[:end]))
+            del self._buffer[:end + 1]
+
+        self._read_frames()
+
+    def finish(self) -> tuple[dict, np.ndarray]:
+        """Return the header and landmark array once the stream has ended."""
+        if self.header is None:
+            raise ValueError("Stream ended before the header line")
+        if self._buffer or self.frames_read != self.landmarks.shape[1]:
+            raise ValueError(
+                f"Stream ended after {self.frames_read} of {self.landmarks.shape[1]} frames"
+            )
+        return self.header, self.landmarks
+
+    def _read_header(self, line: bytes) -> None:
+        try:
+            header = parse_json(line).as_dict()
+        except (ValueError, AttributeError):
+            raise ValueError("Stream header must be a JSON object")
+
+        num_frames = header.get('num_frames')
+        if not isinstance(num_frames, int) or num_frames <= 0:
+            raise ValueError("Stream header needs a positive integer num_frames")
+        if num_frames > self.MAX_FRAMES:
+            raise ValueError(f"Too many frames ({num_frames}). At most {self.MAX_FRAMES} frames are supported.")
+
+        expected_length = len(line) + 1 + num_frames * self.FRAME_BYTES
+        if self.content_length is not None and self.content_length != expected_length:
+            raise ValueError(f"Stream body size does not match {num_frames} frames")
+
+        self.header = header
+        self.landmarks = np.zeros((4, num_frames, TOTAL_POINTS), dtype=np.float32)
+
+    def _read_frames(self) -> None:
+        count = len(self._buffer) // self.FRAME_BYTES
+        if not count:
+            return
+        if self.frames_read + count > self.landmarks.shape[1]:
+            raise ValueError("Stream has more frames than announced in the header")
+
+        frames = np.frombuffer(self._buffer, dtype='<f4', count=count * TOTAL_POINTS * 4)
+        end = self.frames_read + count
+        self.landmarks[:, self.frames_read:end] = frames.reshape(count, TOTAL_POINTS, 4).transpose(2, 0, 1)
+        del frames
+
+        self.frames_read = end
+        del self._buffer[:count * self.FRAME_BYTES]
+
+
+# Scaled pose buffers reused across requests, most recently released first so
+# the returned buffer is likely still in cache
+_buffer_pool = queue.LifoQueue(maxsize=4)
+# Buffers for longer clips (1 minute at 30 fps, about 16 MB per pair) are
+# dropped on release, so one long clip does not pin its memory for good
+MAX_POOLED_FRAMES = 1800
+
+
+def acquire_pose_buffers(num_frames: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Take a data and confidence buffer pair with room for num_frames from the pool.
+
+    Allocates a new pair when the pool is empty or its buffers are too small.
+    Pass the pair to build_pose, then hand it back with release_pose_buffers
+    once the Pose is no longer used.
+    """
+    try:
+        data, confidence = _buffer_pool.get_nowait()
+    except queue.Empty:
+        data = confidence = None
+
+    if data is None or data.shape[0] < num_frames:
+        data = np.empty((num_frames, 1, TOTAL_POINTS, 3), dtype=np.float32)
+        confidence = np.empty((num_frames, 1, TOTAL_POINTS), dtype=np.float32)
+
+    return data, confidence
+
+
+def release_pose_buffers(buffers: tuple[np.ndarray, np.ndarray]) -> None:
+    """Return a buffer pair from acquire_pose_buffers to the pool."""
+    if buffers[0].shape[0] > MAX_POOLED_FRAMES:
+        return
+    try:
+        _buffer_pool.put_nowait(buffers)
+    except queue.Full:
+        pass
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _fill_pose(landmarks, width, height, data, confidence):
+        """Scale landmarks into data and confidence in a single pass."""
+        xs, ys, zs, vis = landmarks[0], landmarks[1], landmarks[2], landmarks[3]
+        for frame_idx in range(xs.shape[0]):
+            for point in range(xs.shape[1]):
+                data[frame_idx, 0, point, 0] = xs[frame_idx, point] * width
+                data[frame_idx, 0, point, 1] = ys[frame_idx, point] * height
+                data[frame_idx, 0, point, 2] = zs[frame_idx, point] * width
+                confidence[frame_idx, 0, point] = vis[frame_idx, point]
+else:
+    _fill_pose = None
+
+
+def scale_landmarks(
+    landmarks: np.ndarray,
+    width: int,
+    height: int,
+    buffers: Optional[tuple[np.ndarray, np.ndarray]] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Scale normalized landmarks to pixel coordinates.
+
+    Uses a Numba kernel when numba is installed, and vectorized NumPy otherwise.
+
+    Args:
+        landmarks: Array of shape (4, frames, total_points) from read_landmarks
+        width: Video width in pixels
+        height: Video height in pixels
+        buffers: Optional pair from acquire_pose_buffers to write into;
+                 the results are views of it
+
+    Returns:
+        data: numpy array of shape (frames, 1, total_points, 3) - XYZ coords
+        confidence: numpy array of shape (frames, 1, total_points) - visibility/confidence
+    """
+    num_frames = landmarks.shape[1]
+
+    if buffers is None:
+        data = np.empty((num_frames, 1, TOTAL_POINTS, 3), dtype=np.float32)
+        confidence = np.empty((num_frames, 1, TOTAL_POINTS), dtype=np.float32)
+    else:
+        data, confidence = buffers[0][:num_frames], buffers[1][:num_frames]
+
+    if _fill_pose is not None:
+        _fill_pose(landmarks, np.float32(width), np.float32(height), data, confidence)
+        return data, confidence
+
+    # Landmarks come normalized (0-1), scale to pixel coords (z scaled by width).
+    # One broadcast multiply writes all three coordinates in a single pass over
+    # data, and visibility is copied without a temporary.
+    scale = np.array([width, height, width], dtype=np.float32)
+    np.multiply(landmarks[:3], scale[:, None, None], out=data[:, 0].transpose(2, 0, 1))
+    np.copyto(confidence[:, 0], landmarks[3])
+
+    return data, confidence
+
+
 def landmarks_to_numpy(
     frames: list[dict],
     width: int,
@@ -54,62 +427,39 @@ def landmarks_to_numpy(
         - 501-521: LEFT_HAND_LANDMARKS (21 points)
         - 522-542: RIGHT_HAND_LANDMARKS (21 points)
     """
-    num_frames = len(frames)
+    return scale_landmarks(read_landmarks(frames), width, height)
 
-    # Standard MediaPipe Holistic point counts
-    POSE_POINTS = 33
-    FACE_POINTS = 468
-    HAND_POINTS = 21
-    TOTAL_POINTS = POSE_POINTS + FACE_POINTS + HAND_POINTS * 2  # 543
 
-    # Initialize arrays with zeros (masked values will remain zero)
-    data = np.zeros((num_frames, 1, TOTAL_POINTS, 3), dtype=np.float32)
-    confidence = np.zeros((num_frames, 1, TOTAL_POINTS), dtype=np.float32)
+def build_pose(
+    landmarks: np.ndarray,
+    width: int,
+    height: int,
+    fps: float = 30.0,
+    buffers: Optional[tuple[np.ndarray, np.ndarray]] = None
+) -> Pose:
+    """
+    Build a Pose object from an array returned by read_landmarks.
+
+    Args:
+        landmarks: Array of shape (4, frames, total_points)
+        width: Video width in pixels
+        height: Video height in pixels
+        fps: Frames per second
+        buffers: Optional pair from acquire_pose_buffers to hold the pose data
 
-    for frame_idx, frame in enumerate(frames):
-        point_offset = 0
+    Returns:
+        Pose object compatible with pose-format ecosystem
+    """
+    header = create_holistic_header(width, height)
+    data, confidence = scale_landmarks(landmarks, width, height, buffers)
 
-        # POSE_LANDMARKS (33 points)
-        pose_landmarks = frame.get('poseLandmarks') or []
-        for i, lm in enumerate(pose_landmarks[:POSE_POINTS]):
-            if lm:
-                # Landmarks come normalized (0-1), scale to pixel coords
-                data[frame_idx, 0, point_offset + i, 0] = lm.get('x', 0) * width
-                data[frame_idx, 0, point_offset + i, 1] = lm.get('y', 0) * height
-                data[frame_idx, 0, point_offset + i, 2] = lm.get('z', 0) * width  # z scaled by width
-                confidence[frame_idx, 0, point_offset + i] = lm.get('visibility', 1.0)
-        point_offset += POSE_POINTS
-
-        # FACE_LANDMARKS (468 points)
-        face_landmarks = frame.get('faceLandmarks') or []
-        for i, lm in enumerate(face_landmarks[:FACE_POINTS]):
-            if lm:
-                data[frame_idx, 0, point_offset + i, 0] = lm.get('x', 0) * width
-                data[frame_idx, 0, point_offset + i, 1] = lm.get('y', 0) * height
-                data[frame_idx, 0, point_offset + i, 2] = lm.get('z', 0) * width
-                confidence[frame_idx, 0, point_offset + i] = lm.get('visibility', 1.0)
-        point_offset += FACE_POINTS
-
-        # LEFT_HAND_LANDMARKS (21 points)
-        left_hand = frame.get('leftHandLandmarks') or []
-        for i, lm in enumerate(left_hand[:HAND_POINTS]):
-            if lm:
-                data[frame_idx, 0, point_offset + i, 0] = lm.get('x', 0) * width
-                data[frame_idx, 0, point_offset + i, 1] = lm.get('y', 0) * height
-                data[frame_idx, 0, point_offset + i, 2] = lm.get('z', 0) * width
-                confidence[frame_idx, 0, point_offset + i] = lm.get('visibility', 1.0)
-        point_offset += HAND_POINTS
-
-        # RIGHT_HAND_LANDMARKS (21 points)
-        right_hand = frame.get('rightHandLandmarks') or []
-        for i, lm in enumerate(right_hand[:HAND_POINTS]):
-            if lm:
-                data[frame_idx, 0, point_offset + i, 0] = lm.get('x', 0) * width
-                data[frame_idx, 0, point_offset + i, 1] = lm.get('y', 0) * height
-                data[frame_idx, 0, point_offset + i, 2] = lm.get('z', 0) * width
-                confidence[frame_idx, 0, point_offset + i] = lm.get('visibility', 1.0)
+    body = NumPyPoseBody(
+        fps=fps,
+        data=data,
+        confidence=confidence
+    )
 
-    return data, confidence
+    return Pose(header=header, body=body)
 
 
 def frames_to_pose(
@@ -130,13 +480,4 @@ def frames_to_pose(
     Returns:
         Pose object compatible with pose-format ecosystem
     """
-    header = create_holistic_header(width, height)
-    data, confidence = landmarks_to_numpy(frames, width, height)
-
-    body = NumPyPoseBody(
-        fps=fps,
-        data=data,
-        confidence=confidence
-    )
-
-    return Pose(header=header, body=body)
+    return build_pose(read_landmarks(frames), width, height, fps)
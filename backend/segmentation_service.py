@@ -5,6 +5,7 @@ Provides a simple interface to run sign language segmentation on Pose objects
 and return structured results.
 """
 
+import numpy as np
 from typing import Optional
 from pose_format import Pose
 
@@ -77,6 +78,20 @@ def _extract_segments(segments: list, fps: float) -> list[dict]:
     Returns:
         List of segment dictionaries with frame and time info
     """
+    if segments and all(isinstance(segment, dict) and 'start' in segment and 'end' in segment
+                        for segment in segments):
+        # Fast path for the dicts the segmentation library returns:
+        # all times are computed and rounded in one vectorized pass
+        starts = np.fromiter((segment['start'] for segment in segments), dtype=np.int64, count=len(segments))
+        ends = np.fromiter((segment['end'] for segment in segments), dtype=np.int64, count=len(segments))
+        start_times = np.round(starts / fps, 3).tolist()
+        end_times = np.round(ends / fps, 3).tolist()
+
+        return [
+            {"start_frame": start, "end_frame": end, "start_time": start_time, "end_time": end_time}
+            for start, end, start_time, end_time in zip(starts.tolist(), ends.tolist(), start_times, end_times)
+        ]
+
     result = []
 
     for segment in segments:
@@ -7,10 +7,17 @@ This module provides functions to:
 3. Run translation inference using the SpaMo model
 """
 
+import atexit
+import contextlib
+import math
 import os
 import sys
 import torch
+import torch.nn.functional as F
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from torchvision.transforms import InterpolationMode, v2
 from PIL import Image
 from typing import List, Dict, Optional, Tuple
 import logging
@@ -23,12 +30,31 @@ sys.path.insert(0, SPAMO_MODEL_DIR)
 
 logger = logging.getLogger(__name__)
 
+# TF32 matmuls and convolutions on Ampere+ GPUs; no autotuning per input shape,
+# since the last batch of a clip usually has a different size
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+torch.backends.cudnn.benchmark = False
+
+SPAMO_CONFIG_PATH = os.path.join(SPAMO_DIR, 'finetune.yaml')
+SPAMO_CHECKPOINT_PATH = os.path.join(SPAMO_DIR, 'spamo.ckpt')
+
+# Inductor compile artifacts, persisted so restarts skip re-tracing the models
+COMPILE_CACHE_PATH = os.path.join(SPAMO_DIR, 'compile_cache.bin')
+_compile_cache_loaded = False
+
 # Global model cache
 _vit_reader = None
 _mae_reader = None
 _spamo_model = None
 _device = 'cpu'
 
+# Runs the two feature extractors side by side, each on its own CUDA stream
+_feature_pool = ThreadPoolExecutor(max_workers=2)
+# Set by warmup() once the compiled extractors have been traced for every
+# batch bucket; dynamo tracing is not thread-safe, so until then they run serially
+_extractors_traced = False
+
 
 def get_device():
     """Get the best available device."""
@@ -37,15 +63,132 @@ def get_device():
     return 'cpu'
 
 
-def sliding_window_for_list(data_list: List, window_size: int, overlap_size: int) -> List[List]:
-    """Apply a sliding window to a list."""
-    step_size = window_size - overlap_size
-    windows = [
-        data_list[i:i + window_size]
-        for i in range(0, len(data_list), step_size)
-        if i + window_size <= len(data_list)
-    ]
-    return windows
+def inference_autocast(device: str):
+    """
+    Mixed-precision context for model forwards on the given device.
+
+    Runs matmuls and attention in BF16 (or FP16 where BF16 is unsupported)
+    on CUDA; on CPU it is a no-op and everything stays FP32.
+    """
+    if device.startswith('cuda'):
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        return torch.autocast(device_type='cuda', dtype=dtype)
+    return contextlib.nullcontext()
+
+
+def compile_model(model: torch.nn.Module, device: str) -> torch.nn.Module:
+    """
+    torch.compile a model for CUDA inference, reusing the on-disk compile cache.
+
+    Models on CPU are returned unchanged. CUDA graphs ("reduce-overhead") are
+    not used, since a graph replay overwrites the outputs of the previous one
+    and the extractors run concurrently from worker threads.
+    """
+    global _compile_cache_loaded
+    if not device.startswith('cuda'):
+        return model
+
+    if not _compile_cache_loaded and hasattr(torch.compiler, 'load_cache_artifacts'):
+        _compile_cache_loaded = True
+        if os.path.exists(COMPILE_CACHE_PATH):
+            with open(COMPILE_CACHE_PATH, 'rb') as f:
+                torch.compiler.load_cache_artifacts(f.read())
+            logger.info(f"Loaded compile cache from: {COMPILE_CACHE_PATH}")
+        atexit.register(save_compile_cache)
+
+    return torch.compile(model, fullgraph=False)
+
+
+def save_compile_cache() -> None:
+    """Write the compile artifacts of this process to COMPILE_CACHE_PATH."""
+    artifacts = torch.compiler.save_cache_artifacts()
+    if artifacts is not None:
+        with open(COMPILE_CACHE_PATH, 'wb') as f:
+            f.write(artifacts[0])
+
+
+def load_with_sdpa(model_cls, model_name: str, **kwargs):
+    """
+    from_pretrained with PyTorch SDPA attention where supported.
+
+    Falls back to transformers' default attention when the model class or the
+    installed torch/transformers pair does not support SDPA.
+    """
+    try:
+        return model_cls.from_pretrained(model_name, attn_implementation="sdpa", **kwargs)
+    except (ImportError, ValueError) as e:
+        logger.warning(f"SDPA attention unavailable for {model_cls.__name__}, using the default: {e}")
+        return model_cls.from_pretrained(model_name, **kwargs)
+
+
+def bucket_size(num_items: int, batch_size: int) -> int:
+    """Smallest power of two holding num_items, capped at batch_size."""
+    return min(1 << (num_items - 1).bit_length(), batch_size)
+
+
+def pad_batch(inputs: torch.Tensor, batch_size: int) -> torch.Tensor:
+    """
+    Pad a batch with zeros to its bucket size (see bucket_size).
+
+    Compiled models then only see a handful of batch shapes, without running
+    a short clip at the full batch_size.
+    """
+    missing = bucket_size(inputs.shape[0], batch_size) - inputs.shape[0]
+    if missing <= 0:
+        return inputs
+    padding = inputs.new_zeros((missing, *inputs.shape[1:]))
+    return torch.cat((inputs, padding))
+
+
+def build_gpu_transform(image_processor) -> v2.Compose:
+    """
+    Build a tensor transform equivalent to a HF image processor's preprocessing.
+
+    Resizes the shortest edge, center crops, rescales to [0, 1] and normalizes,
+    with the sizes and statistics read from the processor's config, so it can
+    run on uint8 frame batches on the model's device.
+    """
+    if image_processor.resample == Image.Resampling.BICUBIC:
+        interpolation = InterpolationMode.BICUBIC
+    else:
+        interpolation = InterpolationMode.BILINEAR
+
+    crop_size = image_processor.crop_size
+    return v2.Compose([
+        v2.Resize(image_processor.size['shortest_edge'], interpolation=interpolation, antialias=True),
+        v2.CenterCrop((crop_size['height'], crop_size['width'])),
+        v2.ToDtype(torch.float32, scale=True),
+        v2.Normalize(mean=image_processor.image_mean, std=image_processor.image_std),
+    ])
+
+
+def allocate_frames(num_frames: int, height: int, width: int) -> np.ndarray:
+    """
+    Allocate a uint8 (N, H, W, 3) array for decoding RGB frames into.
+
+    When CUDA is used the array is backed by pinned host memory, so the
+    extractors can copy it to the device asynchronously without staging.
+    """
+    pixels = torch.empty(
+        (num_frames, height, width, 3),
+        dtype=torch.uint8,
+        pin_memory=get_device().startswith('cuda'),
+    )
+    return pixels.numpy()
+
+
+def frames_to_tensor(frames: np.ndarray, device: str) -> torch.Tensor:
+    """
+    Move uint8 (N, H, W, 3) frames to the device as a (N, 3, H, W) tensor.
+
+    For CUDA the frames are staged in pinned host memory (unless they already
+    live there, see allocate_frames), so the copy to the device is
+    asynchronous and overlaps with queued GPU work.
+    """
+    pixels = torch.from_numpy(frames)
+    if device.startswith('cuda') and not pixels.is_pinned():
+        pixels = pixels.pin_memory()
+    return pixels.to(device, non_blocking=True).permute(0, 3, 1, 2)
 
 
 class ViTFeatureExtractor:
@@ -59,49 +202,87 @@ class ViTFeatureExtractor:
         nth_layer: int = -1
     ):
         from transformers import AutoImageProcessor, CLIPVisionModel
-        from utils.s2wrapper import forward as multiscale_forward
 
         self.device = device
         self.scales = scales
         self.nth_layer = nth_layer
-        self.multiscale_forward = multiscale_forward
 
         logger.info(f"Loading CLIP ViT model: {model_name}")
-        self.model = CLIPVisionModel.from_pretrained(
-            model_name, output_hidden_states=True
-        ).to(device).eval()
+        # Intermediate hidden states are only kept when a layer other than the
+        # last is requested; the last one is last_hidden_state
+        model = load_with_sdpa(
+            CLIPVisionModel, model_name, output_hidden_states=nth_layer != -1
+        ).to(device, memory_format=torch.channels_last).eval()
+        self.model = compile_model(model, device)
+        # Compiled models get batches padded to bucket sizes, to bound recompiles
+        self.fixed_batches = self.model is not model
 
         self.image_processor = AutoImageProcessor.from_pretrained(model_name)
-        logger.info("CLIP ViT model loaded")
+        self.transform = build_gpu_transform(self.image_processor)
+        logger.info(f"CLIP ViT model loaded ({model.config._attn_implementation} attention)")
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def forward_features(self, inputs):
-        outputs = self.model(inputs).hidden_states
-        outputs = outputs[self.nth_layer]
-        return outputs
+        outputs = self.model(inputs)
+        if self.nth_layer == -1:
+            return outputs.last_hidden_state
+        return outputs.hidden_states[self.nth_layer]
+
+    @torch.inference_mode()
+    def multiscale_cls(self, inputs: torch.Tensor) -> torch.Tensor:
+        """
+        CLS features of the s2wrapper multiscale forward, in a single model call.
+
+        Like s2wrapper's forward, each scale resizes the batch and splits it
+        into input-sized tiles, the tile CLS tokens of a scale are averaged and
+        the scales are concatenated along the feature dimension. All tiles of
+        all scales go through the model as one batch, and the patch tokens
+        s2wrapper would merge back are never needed.
+        """
+        batch, _, input_size, _ = inputs.shape
+
+        tiles, tiles_per_scale = [], []
+        for scale in self.scales:
+            size = int(input_size * scale)
+            num_split = math.ceil(size / input_size)
+            scaled = inputs if size == input_size else F.interpolate(inputs, size=size, mode='bicubic')
+            tile = size // num_split
+            tiles.extend(
+                scaled[:, :, i * tile:(i + 1) * tile, j * tile:(j + 1) * tile]
+                for i in range(num_split) for j in range(num_split)
+            )
+            tiles_per_scale.append(num_split ** 2)
+
+        tiles = torch.cat(tiles).contiguous(memory_format=torch.channels_last)
+        cls = self.forward_features(tiles)[:, 0]
+
+        feats = [
+            scale_cls.view(count, batch, -1).mean(dim=0)
+            for scale_cls, count in zip(cls.split([count * batch for count in tiles_per_scale]), tiles_per_scale)
+        ]
+        return torch.cat(feats, dim=-1)
 
-    @torch.no_grad()
-    def get_feats(self, frames: List[Image.Image], batch_size: int = 32) -> np.ndarray:
-        """Extract features from a list of PIL Image frames."""
+    @torch.inference_mode()
+    def get_feats(self, frames: np.ndarray, batch_size: int = 32) -> torch.Tensor:
+        """Extract features from uint8 (N, H, W, 3) RGB frames."""
         all_feats = []
 
         for i in range(0, len(frames), batch_size):
             batch = frames[i:i + batch_size]
-            inputs = self.image_processor(list(batch), return_tensors="pt").to(self.device).pixel_values
-
-            # Use multiscale forward for s2wrapping
-            outputs = self.multiscale_forward(
-                self.forward_features,
-                inputs,
-                scales=self.scales,
-                num_prefix_token=1
-            )
+            # Frames go to the device as uint8 and are preprocessed there
+            inputs = self.transform(frames_to_tensor(batch, self.device))
+            if self.fixed_batches:
+                inputs = pad_batch(inputs, batch_size)
+
+            # Multiscale (s2wrapping) CLS features
+            with inference_autocast(self.device):
+                outputs = self.multiscale_cls(inputs)
 
-            # Extract CLS token
-            feats = outputs[:, 0].cpu().numpy()
+            # Back in FP32 for the translator; it stays on the device
+            feats = outputs[:len(batch)].float()
             all_feats.append(feats)
 
-        return np.concatenate(all_feats, axis=0)
+        return torch.cat(all_feats, dim=0)
 
 
 class VideoMAEFeatureExtractor:
@@ -122,37 +303,61 @@ class VideoMAEFeatureExtractor:
 
         logger.info(f"Loading VideoMAE model: {model_name}")
         self.image_processor = VideoMAEImageProcessor.from_pretrained(model_name)
-        self.model = VideoMAEModel.from_pretrained(model_name).to(device).eval()
-        logger.info("VideoMAE model loaded")
+        self.transform = build_gpu_transform(self.image_processor)
+        model = load_with_sdpa(VideoMAEModel, model_name).to(
+            device, memory_format=torch.channels_last_3d
+        ).eval()
+        self.model = compile_model(model, device)
+        # Compiled models get batches padded to bucket sizes, to bound recompiles
+        self.fixed_batches = self.model is not model
+        # Without a final layernorm the last hidden state is last_hidden_state,
+        # so the intermediate hidden states need not be kept
+        self.output_hidden_states = nth_layer != -1 or model.layernorm is not None
+        logger.info(f"VideoMAE model loaded ({model.config._attn_implementation} attention)")
+
+    @torch.inference_mode()
+    def get_feats(self, frames: np.ndarray, batch_size: int = 32) -> torch.Tensor:
+        """Extract motion features from uint8 (N, H, W, 3) frames using sliding window."""
+        # Preprocess every frame once on the device; overlapping windows share it
+        pixels = torch.cat([
+            self.transform(frames_to_tensor(frames[i:i + batch_size], self.device))
+            for i in range(0, len(frames), batch_size)
+        ])
 
-    @torch.no_grad()
-    def get_feats(self, frames: List[Image.Image], batch_size: int = 32) -> np.ndarray:
-        """Extract motion features from frames using sliding window."""
         # Pad if less than 16 frames
-        if len(frames) < 16:
-            frames = frames + [frames[-1]] * (16 - len(frames))
-
-        # Apply sliding window (window_size=16, overlap=8)
-        chunks = sliding_window_for_list(frames, window_size=16, overlap_size=self.overlap_size)
+        if len(pixels) < 16:
+            pixels = torch.cat((pixels, pixels[-1:].expand(16 - len(pixels), -1, -1, -1)))
 
-        if not chunks:
-            # If video is too short even after padding, use single chunk
-            chunks = [frames[:16]]
+        # Sliding windows (window_size=16, overlap=8) as a strided view of the
+        # frames, shaped (windows, 16, 3, H, W)
+        windows = pixels.unfold(0, 16, 16 - self.overlap_size).permute(0, 4, 1, 2, 3)
 
         all_feats = []
 
-        for i in range(0, len(chunks), batch_size):
-            batch_chunks = chunks[i:i + batch_size]
-            inputs = self.image_processor(images=batch_chunks, return_tensors="pt").to(self.device)
-
-            outputs = self.model(**inputs, output_hidden_states=True).hidden_states
-            outputs = outputs[self.nth_layer]
-
-            # Extract CLS token (first position)
-            feats = outputs[:, 0].cpu().numpy()
+        for i in range(0, len(windows), batch_size):
+            batch_windows = windows[i:i + batch_size]
+            num_windows = len(batch_windows)
+            if self.fixed_batches:
+                batch_windows = pad_batch(batch_windows, batch_size)
+            # The model embeds patches from a (B, C, T, H, W) view of the windows;
+            # lay them out so that view is channels_last_3d like the weights
+            batch_windows = batch_windows.transpose(1, 2).contiguous(
+                memory_format=torch.channels_last_3d
+            ).transpose(1, 2)
+
+            with inference_autocast(self.device):
+                outputs = self.model(pixel_values=batch_windows, output_hidden_states=self.output_hidden_states)
+            if self.output_hidden_states:
+                outputs = outputs.hidden_states[self.nth_layer]
+            else:
+                outputs = outputs.last_hidden_state
+
+            # Extract CLS token (first position), back in FP32 for the translator;
+            # it stays on the device
+            feats = outputs[:num_windows, 0].float()
             all_feats.append(feats)
 
-        return np.concatenate(all_feats, axis=0)
+        return torch.cat(all_feats, dim=0)
 
 
 class SpaMoTranslator:
@@ -180,23 +385,50 @@ class SpaMoTranslator:
         self.model = instantiate_from_config(config.model)
 
         logger.info(f"Loading checkpoint from: {checkpoint_path}")
-        state = torch.load(checkpoint_path, map_location=device)
-        self.model.load_state_dict(state["state_dict"], strict=False)
+        # Memory-map the checkpoint on the CPU: tensors are paged in while being
+        # copied into the model instead of being materialized as a second
+        # copy of the weights (on the device or in RAM) first
+        state = torch.load(checkpoint_path, map_location='cpu', mmap=True)
+        result = self.model.load_state_dict(state["state_dict"], strict=False)
+        del state
+
+        # The checkpoint only holds the trained weights, so missing keys are
+        # expected (pretrained parts); unexpected ones usually mean a mismatch
+        if result.missing_keys:
+            logger.info(f"{len(result.missing_keys)} parameters not in checkpoint, keeping pretrained weights")
+            logger.debug(f"Missing keys: {result.missing_keys}")
+        if result.unexpected_keys:
+            logger.warning(f"Ignoring unexpected checkpoint keys: {result.unexpected_keys}")
 
         self.model = self.model.to(device).eval()
         logger.info("SpaMo model loaded and ready")
 
-    @torch.no_grad()
+    @lru_cache(maxsize=16)
+    def _get_prompt_embeds(self, target_language: str) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Tokenize and embed the prompt for a target language, once per language."""
+        prompt = str(self.model.prompt).format(target_language)
+        input_tokens = self.model.t5_tokenizer(
+            [prompt],
+            padding="longest",
+            truncation=True,
+            return_tensors="pt",
+        ).to(self.device)
+
+        with torch.inference_mode():
+            input_embeds = self.model.t5_model.encoder.embed_tokens(input_tokens.input_ids)
+        return input_embeds, input_tokens.attention_mask
+
+    @torch.inference_mode()
     def translate(
         self,
-        spatial_features: np.ndarray,
-        motion_features: np.ndarray,
+        spatial_features: torch.Tensor,
+        motion_features: torch.Tensor,
         target_language: str = "German"
     ) -> str:
         """Translate sign language features to text."""
-        # Convert to tensors
-        spatial = torch.from_numpy(spatial_features).float().to(self.device)
-        motion = torch.from_numpy(motion_features).float().to(self.device)
+        # Features from the extractors are already on the device, so this is a no-op there
+        spatial = spatial_features.to(self.device, dtype=torch.float32, non_blocking=True)
+        motion = motion_features.to(self.device, dtype=torch.float32, non_blocking=True)
 
         # Prepare input dict matching the expected format
         # Based on the model's prepare_visual_inputs method
@@ -214,49 +446,42 @@ class SpaMoTranslator:
         visual_outputs, visual_masks = self.model.prepare_visual_inputs(samples)
         visual_outputs = self.model.fusion_proj(visual_outputs)
 
-        # Prepare prompt
+        # Prompt embeddings are the same for every sample in the batch
         bs = visual_outputs.shape[0]
-        prompts = [f'{self.model.prompt}'] * bs
-        prompts = [p.format(l) for p, l in zip(prompts, samples['lang'])]
-
-        # Tokenize prompts
-        input_tokens = self.model.t5_tokenizer(
-            prompts,
-            padding="longest",
-            truncation=True,
-            return_tensors="pt",
-        ).to(self.device)
+        input_embeds, prompt_mask = self._get_prompt_embeds(target_language)
+        input_embeds = input_embeds.expand(bs, -1, -1)
 
         # Get lengths
         visual_lengths = visual_masks.sum(1)
-        prompt_lengths = input_tokens.attention_mask.sum(1)
+        prompt_lengths = prompt_mask.sum(1).expand(bs)
         new_lengths = visual_lengths + prompt_lengths
 
-        # Convert tokens to embeddings
-        input_embeds = self.model.t5_model.encoder.embed_tokens(input_tokens.input_ids)
+        # Concatenate each sample's visual and prompt embeddings into one
+        # preallocated, right-padded buffer
+        max_len = int(new_lengths.max())
+        joint_outputs = visual_outputs.new_zeros((bs, max_len, visual_outputs.shape[-1]))
 
-        # Concatenate visual and text embeddings
-        from torch.nn.utils.rnn import pad_sequence
-        from utils.helpers import create_mask
+        visual_positions = torch.arange(visual_outputs.shape[1], device=self.device)
+        rows, cols = (visual_positions[None] < visual_lengths[:, None]).nonzero(as_tuple=True)
+        joint_outputs[rows, cols] = visual_outputs[rows, cols]
 
-        joint_outputs = []
-        for i in range(bs):
-            vis_out = visual_outputs[i, :visual_lengths[i], :]
-            prompt_embeds = input_embeds[i, :prompt_lengths[i], :]
-            concat_sample = torch.cat((vis_out, prompt_embeds), dim=0)
-            joint_outputs.append(concat_sample)
+        prompt_positions = torch.arange(input_embeds.shape[1], device=self.device)
+        rows, cols = (prompt_positions[None] < prompt_lengths[:, None]).nonzero(as_tuple=True)
+        joint_outputs[rows, visual_lengths[rows] + cols] = input_embeds[rows, cols]
 
-        joint_outputs = pad_sequence(joint_outputs, batch_first=True)
-        joint_mask = create_mask(seq_lengths=new_lengths.tolist(), device=self.device)
+        positions = torch.arange(max_len, device=self.device)
+        joint_mask = (positions[None] < new_lengths[:, None]).long()
 
-        # Generate translation
+        # Generate translation with plain (deterministic) beam search
         generated = self.model.t5_model.generate(
             inputs_embeds=joint_outputs,
             attention_mask=joint_mask,
             num_beams=5,
             max_length=self.model.max_txt_len,
-            top_p=0.9,
-            do_sample=True,
+            do_sample=False,
+            early_stopping=True,
+            length_penalty=1.0,
+            use_cache=True,
         )
 
         # Decode
@@ -264,6 +489,25 @@ class SpaMoTranslator:
         return translation[0].lower()
 
 
+@lru_cache(maxsize=1)
+def get_feature_streams() -> Tuple[torch.cuda.Stream, torch.cuda.Stream]:
+    """
+    The CUDA streams of the spatial and motion extractors.
+
+    Created once and reused by every request, so memory the caching allocator
+    keeps for a stream is reused instead of piling up on new streams.
+    """
+    return torch.cuda.Stream(), torch.cuda.Stream()
+
+
+def run_on_stream(stream: torch.cuda.Stream, fn, *args):
+    """Call fn on the given CUDA stream and wait for its kernels to finish."""
+    with torch.cuda.stream(stream):
+        result = fn(*args)
+    stream.synchronize()
+    return result
+
+
 def get_vit_extractor() -> ViTFeatureExtractor:
     """Get or create the ViT feature extractor (singleton)."""
     global _vit_reader
@@ -284,22 +528,20 @@ def get_spamo_model() -> SpaMoTranslator:
     """Get or create the SpaMo model (singleton)."""
     global _spamo_model
     if _spamo_model is None:
-        config_path = os.path.join(SPAMO_DIR, 'finetune.yaml')
-        checkpoint_path = os.path.join(SPAMO_DIR, 'spamo.ckpt')
         _spamo_model = SpaMoTranslator(
-            config_path=config_path,
-            checkpoint_path=checkpoint_path,
+            config_path=SPAMO_CONFIG_PATH,
+            checkpoint_path=SPAMO_CHECKPOINT_PATH,
             device=get_device()
         )
     return _spamo_model
 
 
-def translate_frames(frames: List[Image.Image], target_language: str = "German") -> Dict:
+def translate_frames(frames: np.ndarray, target_language: str = "German") -> Dict:
     """
     Full translation pipeline: extract features and translate.
 
     Args:
-        frames: List of PIL Image frames
+        frames: uint8 (N, H, W, 3) RGB frames, ideally from allocate_frames
         target_language: Target language for translation (German for Phoenix14T)
 
     Returns:
@@ -314,16 +556,25 @@ def translate_frames(frames: List[Image.Image], target_language: str = "German")
 
     logger.info(f"Translating {len(frames)} frames to {target_language}")
 
-    # Extract spatial features
-    logger.info("Extracting spatial features...")
     vit_extractor = get_vit_extractor()
-    spatial_features = vit_extractor.get_feats(frames)
-    logger.info(f"Spatial features shape: {spatial_features.shape}")
-
-    # Extract motion features
-    logger.info("Extracting motion features...")
     mae_extractor = get_mae_extractor()
-    motion_features = mae_extractor.get_feats(frames)
+
+    if get_device().startswith('cuda') and _extractors_traced:
+        # The extractors are independent; on a GPU their kernels interleave
+        # on two streams instead of running back to back
+        logger.info("Extracting spatial and motion features...")
+        spatial_stream, motion_stream = get_feature_streams()
+        spatial_future = _feature_pool.submit(run_on_stream, spatial_stream, vit_extractor.get_feats, frames)
+        motion_future = _feature_pool.submit(run_on_stream, motion_stream, mae_extractor.get_feats, frames)
+        spatial_features = spatial_future.result()
+        motion_features = motion_future.result()
+    else:
+        logger.info("Extracting spatial features...")
+        spatial_features = vit_extractor.get_feats(frames)
+        logger.info("Extracting motion features...")
+        motion_features = mae_extractor.get_feats(frames)
+
+    logger.info(f"Spatial features shape: {spatial_features.shape}")
     logger.info(f"Motion features shape: {motion_features.shape}")
 
     # Translate
@@ -339,3 +590,50 @@ def translate_frames(frames: List[Image.Image], target_language: str = "German")
         'frame_count': len(frames),
         'target_language': target_language
     }
+
+
+def warmup() -> None:
+    """
+    Load all SpaMo models and run the full pipeline once on blank frames.
+
+    Called at service startup so the first request does not pay for model
+    loading, CUDA context creation, kernel selection or torch.compile tracing.
+    On CUDA the extractors are traced serially first; only afterwards does
+    translate_frames run them concurrently.
+
+    Skipped entirely when the SpaMo config or checkpoint is not installed.
+    The translator is loaded before the encoders, so a broken install fails
+    before they are downloaded; on CPU the models are only loaded, since a
+    forward pass there costs more than it saves.
+    """
+    global _extractors_traced
+
+    if not (os.path.exists(SPAMO_CONFIG_PATH) and os.path.exists(SPAMO_CHECKPOINT_PATH)):
+        logger.info(f"No SpaMo config and checkpoint in {SPAMO_DIR}, skipping SpaMo warm-up")
+        return
+
+    get_spamo_model()
+    vit_extractor = get_vit_extractor()
+    mae_extractor = get_mae_extractor()
+
+    if not get_device().startswith('cuda'):
+        logger.info("SpaMo models loaded, skipping the warm-up forward pass on CPU")
+        return
+
+    # Enough frames for the largest VideoMAE bucket of 32 windows
+    stride = 16 - mae_extractor.overlap_size
+    frames = allocate_frames(16 + stride * 31, 224, 224)
+    frames.fill(0)
+
+    # Trace both compiled extractors for every pad_batch bucket (at the
+    # default batch_size of 32) one after the other on this thread, so
+    # requests never trigger tracing from the concurrent worker threads
+    for size in (1, 2, 4, 8, 16, 32):
+        logger.info(f"Tracing feature extractors for batches of {size}...")
+        vit_extractor.get_feats(frames[:size])
+        mae_extractor.get_feats(frames[:16 + stride * (size - 1)])
+    torch.cuda.synchronize()
+    _extractors_traced = True
+
+    translate_frames(frames[:16])
+    logger.info("SpaMo warm-up complete")
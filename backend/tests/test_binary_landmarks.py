@@ -0,0 +1,158 @@
+"""
+Round-trip tests for the binary landmark wire formats shared with the web client.
+
+encode_quantized mirrors RecordingService.buildPayload in
+src/app/services/recording.service.ts, and encode_stream the float32 frame
+layout documented for /api/segment_stream, so a change on either side of
+the format shows up here.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from pose_converter import (
+    QUANT_SCALE, TOTAL_POINTS, VISIBILITY_SCALE, LandmarkStreamReader, read_landmarks_binary
+)
+
+HEADER = {'width': 1280, 'height': 720, 'fps': 30.0}
+
+
+def random_landmarks(num_frames: int, seed: int = 0) -> np.ndarray:
+    """(4, frames, points) landmarks with coordinates inside the quantized range."""
+    rng = np.random.default_rng(seed)
+    landmarks = rng.uniform(-1.9, 1.9, (4, num_frames, TOTAL_POINTS)).astype(np.float32)
+    landmarks[3] = rng.uniform(0, 1, (num_frames, TOTAL_POINTS))
+    return landmarks
+
+
+def header_line(num_frames: int, **fields) -> bytes:
+    return json.dumps({**HEADER, 'num_frames': num_frames, **fields}).encode() + b'\n'
+
+
+def encode_quantized(landmarks: np.ndarray, **fields) -> bytes:
+    """Encode landmarks like the web client: int16 x/y/z blocks, then a uint8 visibility block."""
+    xyz = np.clip(np.round(landmarks[:3] * QUANT_SCALE), -32768, 32767).astype('<i2')
+    visibility = np.round(landmarks[3] * VISIBILITY_SCALE).astype(np.uint8)
+    return header_line(landmarks.shape[1], **fields) + xyz.tobytes() + visibility.tobytes()
+
+
+def encode_stream(landmarks: np.ndarray) -> bytes:
+    """Encode landmarks as the float32 (frames, points, 4) stream format."""
+    frames = np.ascontiguousarray(landmarks.transpose(1, 2, 0), dtype='<f4')
+    return header_line(landmarks.shape[1]) + frames.tobytes()
+
+
+def read_stream(body: bytes, chunk_size: int, content_length=None):
+    reader = LandmarkStreamReader(content_length)
+    for start in range(0, len(body), chunk_size):
+        reader.feed(body[start:start + chunk_size])
+    return reader.finish()
+
+
+class TestQuantizedLandmarks:
+    def test_round_trip_within_quantization_error(self):
+        landmarks = random_landmarks(12)
+        values, decoded = read_landmarks_binary(encode_quantized(landmarks), ('width', 'height', 'fps'))
+
+        assert values == HEADER
+        assert decoded.shape == landmarks.shape
+        assert decoded.dtype == np.float32
+        xyz_error = np.abs(decoded[:3] - landmarks[:3]).max()
+        visibility_error = np.abs(decoded[3] - landmarks[3]).max()
+        assert xyz_error <= 0.5 / QUANT_SCALE + 1e-6
+        assert visibility_error <= 0.5 / VISIBILITY_SCALE + 1e-6
+
+    def test_out_of_range_coordinates_saturate(self):
+        landmarks = random_landmarks(1)
+        landmarks[0, 0, :2] = (5.0, -5.0)
+        _, decoded = read_landmarks_binary(encode_quantized(landmarks), ())
+
+        assert decoded[0, 0, 0] == pytest.approx(32767 / QUANT_SCALE)
+        assert decoded[0, 0, 1] == pytest.approx(-2.0)
+
+    def test_only_requested_fields_are_returned(self):
+        body = encode_quantized(random_landmarks(2), target_language='de', extra=1)
+        values, _ = read_landmarks_binary(body, ('fps', 'target_language', 'missing'))
+        assert values == {'fps': 30.0, 'target_language': 'de'}
+
+    @pytest.mark.parametrize('body', [
+        pytest.param(b'{"num_frames": 1}', id='no-header-line'),
+        pytest.param(b'[1, 2]\n', id='header-not-object'),
+        pytest.param(b'not json\n', id='header-not-json'),
+        pytest.param(header_line(0), id='zero-frames'),
+        pytest.param(header_line(1.5), id='fractional-frames'),
+    ])
+    def test_invalid_header(self, body):
+        with pytest.raises(ValueError):
+            read_landmarks_binary(body, ())
+
+    def test_truncated_body(self):
+        with pytest.raises(ValueError, match='size'):
+            read_landmarks_binary(encode_quantized(random_landmarks(3))[:-1], ())
+
+    def test_extra_bytes(self):
+        with pytest.raises(ValueError, match='size'):
+            read_landmarks_binary(encode_quantized(random_landmarks(3)) + b'\0', ())
+
+    def test_oversized_frame_count(self):
+        # The announced frames must match the body before anything is allocated
+        body = header_line(10 ** 9) + encode_quantized(random_landmarks(1)).split(b'\n', 1)[1]
+        with pytest.raises(ValueError, match='size'):
+            read_landmarks_binary(body, ())
+
+
+class TestLandmarkStream:
+    @pytest.mark.parametrize('chunk_size', [1, 777, LandmarkStreamReader.FRAME_BYTES, 1 << 20])
+    def test_round_trip(self, chunk_size):
+        landmarks = random_landmarks(5)
+        body = encode_stream(landmarks)
+        header, decoded = read_stream(body, chunk_size, content_length=len(body))
+
+        assert header == {**HEADER, 'num_frames': 5}
+        np.testing.assert_array_equal(decoded, landmarks)
+
+    def test_without_content_length(self):
+        landmarks = random_landmarks(2)
+        _, decoded = read_stream(encode_stream(landmarks), 1000)
+        np.testing.assert_array_equal(decoded, landmarks)
+
+    def test_truncated_stream(self):
+        body = encode_stream(random_landmarks(3))
+        with pytest.raises(ValueError, match='ended after'):
+            read_stream(body[:-1], 1000)
+        with pytest.raises(ValueError, match='ended after 2 of 3'):
+            read_stream(body[:-LandmarkStreamReader.FRAME_BYTES], 1000)
+
+    def test_stream_without_header(self):
+        with pytest.raises(ValueError, match='before the header'):
+            read_stream(b'{"num_frames": 1}', 1000)
+
+    def test_extra_frame(self):
+        body = encode_stream(random_landmarks(2)) + encode_stream(random_landmarks(1)).split(b'\n', 1)[1]
+        with pytest.raises(ValueError, match='more frames'):
+            read_stream(body, 1 << 20)
+
+    def test_extra_bytes(self):
+        with pytest.raises(ValueError, match='ended after'):
+            read_stream(encode_stream(random_landmarks(2)) + b'\0', 1 << 20)
+
+    def test_oversized_frame_count(self):
+        body = header_line(LandmarkStreamReader.MAX_FRAMES + 1)
+        with pytest.raises(ValueError, match='Too many frames'):
+            read_stream(body, 1000)
+
+    def test_content_length_mismatch(self):
+        body = encode_stream(random_landmarks(2))
+        with pytest.raises(ValueError, match='size'):
+            read_stream(body, 1000, content_length=len(body) + 1)
+
+    def test_header_line_too_long(self):
+        with pytest.raises(ValueError, match='too long'):
+            read_stream(b' ' * (LandmarkStreamReader.MAX_HEADER_BYTES + 1), 1 << 20)
+
+    @pytest.mark.parametrize('header', [b'[1]\n', b'{"num_frames": 0}\n', b'{"num_frames": "3"}\n'])
+    def test_invalid_header(self, header):
+        with pytest.raises(ValueError):
+            read_stream(header, 1000)
@@ -7,11 +7,25 @@ with sign segments into SignWriting notation.
 
 import tempfile
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, NamedTuple
 from pose_format import Pose
+from pose_format.utils.generic import reduce_holistic
 import pympi
 
 
+# JoeyNMT config written next to the checkpoint by download_model
+TRANSCRIPTION_CONFIG = 'experiment/config.yaml'
+
+
+class TranscriptionModel(NamedTuple):
+    """A loaded JoeyNMT pose-to-SignWriting model and its prediction inputs."""
+    model: Any
+    args: Any
+    test_data: Any
+
+
 def transcribe_pose_to_signwriting(pose: Pose, eaf_path: str) -> list[dict]:
     """
     Transcribe pose segments to SignWriting notation.
@@ -93,6 +107,102 @@ def transcribe_pose_to_signwriting(pose: Pose, eaf_path: str) -> list[dict]:
     return results
 
 
+def download_transcription_model() -> None:
+    """Download the pose-to-SignWriting model into ./experiment if missing."""
+    from signwriting_transcription.pose_to_signwriting.bin import download_model
+
+    experiment_dir = Path('experiment')
+    experiment_dir.mkdir(exist_ok=True)
+    download_model(experiment_dir, 'bc2de71.ckpt')
+
+
+@lru_cache(maxsize=1)
+def get_transcription_model() -> TranscriptionModel:
+    """
+    Load and cache the pose-to-SignWriting model.
+
+    Parses the config, builds the vocabularies and restores the checkpoint
+    once per process instead of on every sw_translate call.
+    """
+    from joeynmt.config import load_config, parse_global_args
+    from signwriting_transcription.pose_to_signwriting.joeynmt_pose.prediction import prepare
+
+    cfg = load_config(Path(TRANSCRIPTION_CONFIG))
+    args = parse_global_args(cfg, rank=0, mode="translate")
+    model, _, _, test_data = prepare(args, rank=0, mode="translate")
+
+    return TranscriptionModel(model=model, args=args, test_data=test_data)
+
+
+def sw_translate_preloaded(sw_model: TranscriptionModel, pose_files: list[str]) -> list[str]:
+    """
+    Transcribe sign poses to SignWriting with an already loaded model.
+
+    Equivalent to the library's translate(config, pose_files) without the
+    config parsing and checkpoint loading. Like translate, it takes the .pose
+    file paths written by preprocessing_signs.
+    """
+    from signwriting_transcription.pose_to_signwriting.joeynmt_pose.prediction import predict
+
+    args = sw_model.args
+    test_data = sw_model.test_data
+
+    # The stream dataset is reused between calls, drop the previous inputs
+    test_data.reset_cache()
+    for pose_file in pose_files:
+        test_data.set_item(pose_file)
+
+    _, _, hypotheses, _, _, _ = predict(
+        model=sw_model.model,
+        data=test_data,
+        compute_loss=False,
+        device=args.device,
+        rank=0,
+        n_gpu=args.n_gpu,
+        normalization="none",
+        num_workers=args.num_workers,
+        args=args.test,
+        autocast=args.autocast,
+    )
+
+    return hypotheses
+
+
+def init_transcription_worker() -> None:
+    """
+    Prepare a transcription worker process.
+
+    Limits torch to one thread per process, since signs are already spread
+    across processes, and loads the model once for the lifetime of the worker.
+    """
+    import torch
+
+    torch.set_num_threads(1)
+    get_transcription_model()
+
+
+def transcribe_signs(pose: Pose, sign_annotations: list[tuple[int, int, str]]) -> list[str]:
+    """
+    Transcribe sign segments of a reduced holistic pose to SignWriting.
+
+    The signs are cut with the library's preprocessing_signs ("tight"
+    strategy) into .pose files in a temporary directory, exactly as the
+    library's own pipeline does, and transcribed with the cached model.
+
+    Args:
+        pose: Pose object already passed through reduce_holistic
+        sign_annotations: List of (start_ms, end_ms, value) sign segments
+
+    Returns:
+        List of SignWriting strings, one per sign
+    """
+    from signwriting_transcription.pose_to_signwriting.bin import preprocessing_signs
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pose_files = preprocessing_signs(pose, sign_annotations, 'tight', temp_dir)
+        return sw_translate_preloaded(get_transcription_model(), pose_files)
+
+
 def transcribe_pose_simple(pose_path: str, eaf_path: str) -> list[str]:
     """
     Simple interface to transcribe pose file to SignWriting.
@@ -104,23 +214,14 @@ def transcribe_pose_simple(pose_path: str, eaf_path: str) -> list[str]:
     Returns:
         List of SignWriting strings for each sign segment
     """
-    # Use the CLI-style approach which is more reliable
-    from signwriting_transcription.pose_to_signwriting.bin import main
-    import sys
+    with open(pose_path, 'rb') as f:
+        pose = Pose.read(f.read())
 
-    # Capture the output
-    old_argv = sys.argv
-    sys.argv = ['bin.py', '--pose', pose_path, '--elan', eaf_path]
-
-    try:
-        main()
-    finally:
-        sys.argv = old_argv
-
-    # Read back the updated ELAN file to get SignWriting annotations
     eaf = pympi.Elan.Eaf(file_path=eaf_path)
-
-    # The transcription adds SignWriting to the SIGN tier values
     sign_tier = eaf.get_annotation_data_for_tier("SIGN")
+    if not sign_tier:
+        return []
 
-    return [annotation[2] for annotation in sign_tier if annotation[2]]
+    # Same steps as the /api/translate pipeline, with the cached model
+    signwriting = transcribe_signs(reduce_holistic(pose), sign_tier)
+    return [sw for sw in signwriting if sw]
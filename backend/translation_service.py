@@ -5,6 +5,8 @@ Uses the sockeye-signwriting-to-text model from HuggingFace
 to translate SignWriting notation to English text.
 """
 
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from signwriting.tokenizer import SignWritingTokenizer
 from signwriting_translation.bin import load_sockeye_translator, translate
@@ -16,6 +18,23 @@ MODEL_ID = "sign/sockeye-signwriting-to-text"
 # SignWriting tokenizer
 sw_tokenizer = SignWritingTokenizer()
 
+# LRU cache of translations keyed by (signwriting, target_language)
+TRANSLATION_CACHE_SIZE = 50_000
+_translation_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+# The translator is shared between executor threads and resized per batch
+_translator_lock = threading.Lock()
+
+# Largest batch for one Sockeye forward pass; longer inputs are split
+MAX_TRANSLATE_BATCH = 64
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(signwriting: str) -> str:
+    """Tokenize a SignWriting string into the space-separated model input form."""
+    return " ".join(sw_tokenizer.text_to_tokens(signwriting))
+
 
 @lru_cache(maxsize=1)
 def get_translator():
@@ -35,27 +54,16 @@ def signwriting_to_text(signwriting: str, target_language: str = "en") -> str:
     Returns:
         Translated text string
     """
-    translator = get_translator()
-
-    # Tokenize the SignWriting
-    tokenized = " ".join(sw_tokenizer.text_to_tokens(signwriting))
-
-    # Add language prefix
-    model_input = f"${target_language} {tokenized}"
-
-    # Translate
-    outputs = translate(translator, [model_input])
-
-    # Clean up BPE tokens (remove @@ markers)
-    text = outputs[0].replace("@@", "")
-
-    return text
+    return translate_signs([signwriting], target_language)[0]
 
 
 def translate_signs(signwriting_list: list[str], target_language: str = "en") -> list[str]:
     """
     Translate multiple SignWriting strings to text in batch.
 
+    Translations are cached per (signwriting, target_language), so repeated
+    signs are only sent to the model once.
+
     Args:
         signwriting_list: List of SignWriting FSW strings
         target_language: Target language code (default: "en" for English)
@@ -66,16 +74,48 @@ def translate_signs(signwriting_list: list[str], target_language: str = "en") ->
     if not signwriting_list:
         return []
 
-    translator = get_translator()
+    # Serve repeated signs from the cache and translate only the misses
+    with _translation_cache_lock:
+        cached = {}
+        for sw in signwriting_list:
+            key = (sw, target_language)
+            if key in _translation_cache:
+                _translation_cache.move_to_end(key)
+                cached[sw] = _translation_cache[key]
 
-    # Prepare all inputs
-    model_inputs = []
-    for sw in signwriting_list:
-        tokenized = " ".join(sw_tokenizer.text_to_tokens(sw))
-        model_inputs.append(f"${target_language} {tokenized}")
+    misses = list(dict.fromkeys(sw for sw in signwriting_list if sw not in cached))
+    if misses:
+        translated = _translate_batch(misses, target_language)
+        cached.update(zip(misses, translated))
+
+        with _translation_cache_lock:
+            for sw, text in zip(misses, translated):
+                _translation_cache[(sw, target_language)] = text
+            while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+                _translation_cache.popitem(last=False)
 
-    # Batch translate
-    outputs = translate(translator, model_inputs)
+    return [cached[sw] for sw in signwriting_list]
 
-    # Clean up BPE tokens
-    return [out.replace("@@", "") for out in outputs]
+
+def _translate_batch(signwriting_list: list[str], target_language: str) -> list[str]:
+    """Run the translation model on a batch of SignWriting strings."""
+    translator = get_translator()
+
+    # Prepare all inputs
+    prefix = f"${target_language} "
+    model_inputs = [prefix + _tokenize(sw) for sw in signwriting_list]
+
+    # Batch translate in as few forward passes as possible. The Sockeye
+    # translator splits its input into batches of translator.batch_size
+    # (padding the last one), so size the batch to the input, up to
+    # MAX_TRANSLATE_BATCH, instead of one pass per sign.
+    with _translator_lock:
+        batch_size = translator.batch_size
+        translator.batch_size = min(len(model_inputs), MAX_TRANSLATE_BATCH)
+        try:
+            outputs = translate(translator, model_inputs)
+        finally:
+            translator.batch_size = batch_size
+
+    # Clean up BPE tokens (remove @@ markers) in one pass over all outputs
+    return "\n".join(outputs).replace("@@", "").split("\n")
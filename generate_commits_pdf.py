@@ -2,10 +2,11 @@
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, HRFlowable
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from datetime import datetime
+from html import escape
 
 commits = [
     {
@@ -138,6 +139,10 @@ body_style = ParagraphStyle(
     leftIndent=12,
 )
 
+# Spacers carry no state, so one instance of each size is reused
+section_spacer = Spacer(1, 0.2*inch)
+metadata_spacer = Spacer(1, 0.1*inch)
+
 # Add title
 title = Paragraph("Sign2Speech - Last 5 Commits", title_style)
 elements.append(title)
@@ -146,7 +151,7 @@ elements.append(title)
 subtitle = Paragraph(f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", subtitle_style)
 elements.append(subtitle)
 
-elements.append(Spacer(1, 0.2*inch))
+elements.append(section_spacer)
 
 # Add commits
 for i, commit in enumerate(commits, 1):
@@ -166,22 +171,19 @@ for i, commit in enumerate(commits, 1):
     date_text = Paragraph(f"<b>Date:</b> {commit['date']}", metadata_style)
     elements.append(date_text)
 
-    elements.append(Spacer(1, 0.1*inch))
+    elements.append(metadata_spacer)
 
-    # Commit body - split into lines
-    body_lines = commit['body'].split('\n')
+    # Commit body - escape special characters for XML once, then split into lines
+    body_lines = escape(commit['body'], quote=False).split('\n')
     for line in body_lines:
         if line.strip():
-            # Escape special characters for XML
-            line_escaped = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            body_para = Paragraph(line_escaped, body_style)
+            body_para = Paragraph(line, body_style)
             elements.append(body_para)
 
     # Add separator
     if i < len(commits):
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(section_spacer)
         # Add a horizontal line
-        from reportlab.platypus import HRFlowable
         elements.append(HRFlowable(width="100%", thickness=1, color=colors.lightgrey, spaceAfter=0.1*inch))
 
 # Build PDF
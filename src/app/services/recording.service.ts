@@ -1,7 +1,7 @@
 import {inject, Injectable} from '@angular/core';
 import {HttpClient} from '@angular/common/http';
 import {BehaviorSubject, Observable, firstValueFrom} from 'rxjs';
-import {EstimatedPose, PoseLandmark} from '../modules/pose/pose.state';
+import {EstimatedPose} from '../modules/pose/pose.state';
 import {environment} from '../../environments/environment';
 
 export interface SegmentBoundary {
@@ -46,26 +46,16 @@ export interface SegmentationResult {
 
 export type RecordingState = 'idle' | 'recording' | 'processing';
 
-interface LandmarkPayload {
-  x: number;
-  y: number;
-  z: number;
-  visibility?: number;
-}
-
-interface FramePayload {
-  poseLandmarks: LandmarkPayload[] | null;
-  faceLandmarks: LandmarkPayload[] | null;
-  leftHandLandmarks: LandmarkPayload[] | null;
-  rightHandLandmarks: LandmarkPayload[] | null;
-}
-
-interface SegmentRequest {
-  frames: FramePayload[];
-  width: number;
-  height: number;
-  fps: number;
-}
+// Landmarks are sent as a quantized binary body, see read_landmarks_binary in the backend
+const HOLISTIC_LAYOUT: [keyof Omit<EstimatedPose, 'image'>, number][] = [
+  ['poseLandmarks', 33],
+  ['faceLandmarks', 468],
+  ['leftHandLandmarks', 21],
+  ['rightHandLandmarks', 21],
+];
+const TOTAL_POINTS = 543;
+const QUANT_SCALE = 16384;
+const VISIBILITY_SCALE = 255;
 
 @Injectable({
   providedIn: 'root',
@@ -164,8 +154,12 @@ export class RecordingService {
     const payload = this.buildPayload();
     const backendUrl = environment.backendUrl || 'http://localhost:8000';
 
-    console.log(`📤 Sending ${payload.frames.length} frames to ${backendUrl}/api/translate`);
-    const result = await firstValueFrom(this.http.post<TranslationResult>(`${backendUrl}/api/translate`, payload));
+    console.log(`📤 Sending ${this.frames.length} frames (${payload.byteLength} B) to ${backendUrl}/api/translate`);
+    const result = await firstValueFrom(
+      this.http.post<TranslationResult>(`${backendUrl}/api/translate`, payload, {
+        headers: {'Content-Type': 'application/octet-stream'},
+      })
+    );
 
     console.log('📥 Translation result:');
     console.log(`   Signs: ${result.signs.length}`);
@@ -178,38 +172,48 @@ export class RecordingService {
     return result;
   }
 
-  private buildPayload(): SegmentRequest {
+  private buildPayload(): ArrayBuffer {
     // Get dimensions from first frame's image
     const firstFrame = this.frames[0];
     const width = firstFrame?.image?.width || 1280;
     const height = firstFrame?.image?.height || 720;
 
-    const frames: FramePayload[] = this.frames.map(pose => ({
-      poseLandmarks: this.convertLandmarks(pose.poseLandmarks),
-      faceLandmarks: this.convertLandmarks(pose.faceLandmarks),
-      leftHandLandmarks: this.convertLandmarks(pose.leftHandLandmarks),
-      rightHandLandmarks: this.convertLandmarks(pose.rightHandLandmarks),
-    }));
-
-    return {
-      frames,
-      width,
-      height,
-      fps: this.fps,
-    };
-  }
+    const numFrames = this.frames.length;
+    const header = new TextEncoder().encode(
+      JSON.stringify({width, height, fps: this.fps, num_frames: numFrames}) + '\n'
+    );
+
+    // x, y, z blocks of (frames, points) int16, then one (frames, points) uint8 visibility block.
+    // Missing landmarks stay zero, like on the JSON path. Typed arrays are little-endian on all supported platforms.
+    const plane = numFrames * TOTAL_POINTS;
+    const xyz = new Int16Array(3 * plane);
+    const visibility = new Uint8Array(plane);
+
+    this.frames.forEach((pose, f) => {
+      let point = f * TOTAL_POINTS;
+      for (const [component, count] of HOLISTIC_LAYOUT) {
+        const landmarks = pose[component] ?? [];
+        const n = Math.min(landmarks.length, count);
+        for (let i = 0; i < n; i++) {
+          const lm = landmarks[i];
+          xyz[point + i] = this.quantize(lm.x);
+          xyz[plane + point + i] = this.quantize(lm.y);
+          xyz[2 * plane + point + i] = this.quantize(lm.z);
+          visibility[point + i] = Math.round((lm.visibility ?? 1) * VISIBILITY_SCALE);
+        }
+        point += count;
+      }
+    });
 
-  private convertLandmarks(landmarks: PoseLandmark[] | null): LandmarkPayload[] | null {
-    if (!landmarks || landmarks.length === 0) {
-      return null;
-    }
+    const body = new Uint8Array(header.byteLength + xyz.byteLength + visibility.byteLength);
+    body.set(header, 0);
+    body.set(new Uint8Array(xyz.buffer), header.byteLength);
+    body.set(visibility, header.byteLength + xyz.byteLength);
+    return body.buffer;
+  }
 
-    return landmarks.map(lm => ({
-      x: lm.x,
-      y: lm.y,
-      z: lm.z,
-      visibility: lm.visibility,
-    }));
+  private quantize(value: number): number {
+    return Math.max(-32768, Math.min(32767, Math.round(value * QUANT_SCALE)));
   }
 
   async stopRecordingSpaMo(): Promise<TranslationResult | null> {